@@ -4,6 +4,7 @@ import json
 import os
 import matplotlib.pyplot as plt
 import inspect
+from scipy.spatial import cKDTree
 
 import properties
 from SimPEG import Utils
@@ -59,6 +60,47 @@ class BaseMeshGenerator(BaseCasing):
             )
         return self._mesh
 
+    @property
+    def kdtree_Fz(self):
+        """
+        KD-tree of the z-face locations, used to find the faces closest to
+        a point
+        """
+        if getattr(self, '_kdtree_Fz', None) is None:
+            self._kdtree_Fz = cKDTree(self.mesh.gridFz)
+        return self._kdtree_Fz
+
+    def closest_Fz(self, loc):
+        """
+        Index of the z-face closest to loc. Faces that are equally close are
+        resolved to the lowest index, as in discretize.utils.closestPoints
+
+        :param numpy.ndarray loc: location (x, y, z)
+        :rtype: int
+        :return: index of the closest z-face
+        """
+        loc = np.asarray(loc, dtype=float)
+        dist, _ = self.kdtree_Fz.query(loc)
+
+        # the tree makes no promise about which of several equidistant faces
+        # it returns, so gather everything about as close and compare the
+        # squared distances the way closestPoints does
+        candidates = np.sort(
+            self.kdtree_Fz.query_ball_point(loc, dist*(1. + 1e-8) + 1e-12)
+        ).astype(int)
+        grid = self.mesh.gridFz[candidates, :]
+        return candidates[((grid - loc)**2).sum(axis=1).argmin()]
+
+    @property
+    def source_cache(self):
+        """
+        face indices of source wire paths found on this mesh, shared by the
+        sources that are built on it
+        """
+        if getattr(self, '_source_cache', None) is None:
+            self._source_cache = {}
+        return self._source_cache
+
 
 class TensorMeshGenerator(BaseMeshGenerator):
     """
@@ -123,7 +165,7 @@ class TensorMeshGenerator(BaseMeshGenerator):
     # Instantiate the class with casing parameters
     def __init__(self, **kwargs):
         super(TensorMeshGenerator, self).__init__(**kwargs)
-        self._discretize_pair = discretize.TensorMesh
+        self._discretizePair = discretize.TensorMesh
 
     @property
     def x0(self):
@@ -1,10 +1,10 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+import hashlib
 
 import properties
 import discretize
-from discretize.utils import closestPoints
 
 from SimPEG import Utils
 from SimPEG.EM import FDEM, TDEM
@@ -14,6 +14,45 @@ from . import model
 from .mesh import BaseMeshGenerator
 from .info import __version__
 
+# directory that s_e is saved to when a source has cache_s_e set
+S_E_CACHE_DIRECTORY = os.path.join(
+    os.path.expanduser('~'), '.cache', 'casingSimulations'
+)
+
+# part of the name of the cached s_e files: bump it when the way s_e is
+# assembled changes so that files written by older code are not loaded
+S_E_CACHE_VERSION = 1
+
+# os.rename does not overwrite an existing file on Windows, os.replace
+# (python 3.3+) does
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _faces_within(grid, bounds):
+    """
+    Indices of the faces whose locations lie within all of the bands. The
+    first band is evaluated on every face, the remaining ones only on the
+    faces that are still candidates, so the narrowest band (one cell wide)
+    should be given first.
+
+    :param numpy.ndarray grid: face locations (nF x 3)
+    :param list bounds: (column, lower comparison, lower value, upper
+        comparison, upper value) tuples, for example
+        (2, numpy.greater, -1., numpy.less, 0.) keeps faces with -1 < z < 0
+    :rtype: numpy.ndarray
+    :return: indices (int32) of the faces within every band
+    """
+    col, lo_compare, lo, hi_compare, hi = bounds[0]
+    column = grid[:, col]
+    within = lo_compare(column, lo)
+    within &= hi_compare(column, hi)
+    inds = np.flatnonzero(within)
+
+    for col, lo_compare, lo, hi_compare, hi in bounds[1:]:
+        column = grid[inds, col]
+        inds = inds[lo_compare(column, lo) & hi_compare(column, hi)]
+    return inds.astype(np.int32)
+
 
 class BaseCasingSrc(BaseCasing):
     """
@@ -40,6 +79,11 @@ class BaseCasingSrc(BaseCasing):
         choices=["FDEM", "TDEM"]
     )
 
+    cache_s_e = properties.Bool(
+        "save s_e to disk and re-load it for the same source and mesh?",
+        default=False
+    )
+
     def __init__(self, **kwargs):
         Utils.setKwargs(self, **kwargs)
         assert self.cp.src_a[1] == self.cp.src_b[1], (
@@ -66,6 +110,148 @@ class BaseCasingSrc(BaseCasing):
     def freqs(self):
         return self.cp.freqs
 
+    def _closest_Fz(self, loc):
+        """
+        location of the z-face closest to loc
+        """
+        return self.mesh.gridFz[self.meshGenerator.closest_Fz(loc), :]
+
+    @property
+    def _geometry(self):
+        """
+        electrode locations and casing radius (if there is a casing), used
+        to identify cached quantities
+        """
+        return (
+            tuple(self.src_a), tuple(self.src_b),
+            getattr(self.cp, 'casing_a', None)
+        )
+
+    def _shared_indices(self, name, find):
+        """
+        Face indices of the wire segment ``name`` for this source geometry.
+        They are looked up in the cache held on the mesh generator and only
+        computed with ``find`` if no source on this mesh has done so yet.
+        """
+        key = (name, ) + self._geometry
+        cache = self.meshGenerator.source_cache
+        if key not in cache:
+            cache[key] = find()
+        return cache[key]
+
+    @properties.observer('meshGenerator')
+    def _reset_mesh_cache(self, change):
+        # everything derived from the mesh needs to be recomputed
+        for attr in [
+            '_cell_mins_cache', '_is_symmetric_cache', '_src_a_closest',
+            '_src_b_closest', '_surface_wire', '_wire_in_borehole',
+            '_surface_electrode', '_downhole_electrode', '_tophole_electrode',
+            '_s_e', '_srcList', '_wire_checked', '_wire_more_checked'
+        ]:
+            setattr(self, attr, None)
+
+    @property
+    def _cell_mins(self):
+        """
+        minimum cell widths (hx, hy, hz) of the mesh
+        """
+        if getattr(self, '_cell_mins_cache', None) is None:
+            mesh = self.mesh
+            self._cell_mins_cache = (
+                mesh.hx.min(), mesh.hy.min(), mesh.hz.min()
+            )
+        return self._cell_mins_cache
+
+    @property
+    def _is_symmetric(self):
+        """
+        is the mesh cylindrically symmetric (no y-discretization)?
+        """
+        if getattr(self, '_is_symmetric_cache', None) is None:
+            self._is_symmetric_cache = getattr(
+                self.mesh, 'isSymmetric', False
+            )
+        return self._is_symmetric_cache
+
+    @property
+    def _s_e_cache_path(self):
+        """
+        file that s_e is cached in. The name is a hash of the source type,
+        the cache version, the source geometry and the mesh.
+        """
+        mesh = self.mesh
+        sha = hashlib.sha1(
+            '{} {} {}'.format(
+                self.__class__.__name__, __version__, S_E_CACHE_VERSION
+            ).encode()
+        )
+        # hash the values rather than their reprs, which are not stable
+        # across numpy versions
+        casing_a = self._geometry[2]
+        for h in [
+            self.src_a, self.src_b,
+            [] if casing_a is None else [casing_a],
+            mesh.vnC, mesh.hx, mesh.hy, mesh.hz, mesh.x0
+        ]:
+            sha.update(np.asarray(h, dtype=float).tobytes())
+        return os.path.join(
+            S_E_CACHE_DIRECTORY, 's_e_{}.npy'.format(sha.hexdigest()[:16])
+        )
+
+    def _cached_s_e(self, assemble):
+        """
+        s_e built by assemble. If cache_s_e is set, it is loaded from the
+        cache directory when it has been saved for this source and mesh
+        before, and saved there otherwise.
+
+        :param callable assemble: function that assembles s_e
+        :rtype: numpy.ndarray
+        :return: source current density on faces
+        """
+        if self.cache_s_e is False:
+            return assemble()
+
+        path = self._s_e_cache_path
+        if os.path.isfile(path):
+            s_e = np.load(path)
+            # a file that does not fit the mesh is re-built and overwritten
+            if s_e.shape == (self.mesh.nF, ):
+                return s_e
+
+        s_e = assemble()
+
+        # another run may create the directory at the same time
+        try:
+            os.makedirs(S_E_CACHE_DIRECTORY)
+        except OSError:
+            if not os.path.isdir(S_E_CACHE_DIRECTORY):
+                raise
+
+        # write to a temporary file first so that a simulation running in
+        # parallel never loads a partially written file
+        tmp = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmp, 'wb') as f:
+            np.save(f, s_e)
+        _replace(tmp, path)
+        return s_e
+
+    def _scale_by_inv_area(self, s_e, x_inds=(), z_inds=()):
+        """
+        Scale the wire path in s_e by the reciprocal of the face areas. Only
+        the x- and z-faces listed are non-zero, so only those are divided by
+        their areas and the rest of s_e is left as is.
+
+        :param numpy.ndarray s_e: source vector on all faces
+        :param list x_inds: arrays of x-face indices on the wire path
+        :param list z_inds: arrays of z-face indices on the wire path
+        :rtype: numpy.ndarray
+        :return: s_e, scaled in place
+        """
+        nFx, nFy, _ = self.mesh.vnF
+        inds = np.hstack(list(x_inds) + [nFx + nFy + i for i in z_inds])
+        s_e[inds] /= self.mesh.area[inds]
+        return s_e
+
     @property
     def srcList(self):
         """
@@ -73,9 +259,10 @@ class BaseCasingSrc(BaseCasing):
         """
         if getattr(self, '_srcList', None) is None:
             if self.physics == "FDEM":
+                # the same (complex) source vector is used at every frequency
+                s_e = self.s_e.astype("complex")
                 srcList = [
-                    FDEM.Src.RawVec_e([], _, self.s_e.astype("complex"))
-                    for _ in self.freqs
+                    FDEM.Src.RawVec_e([], _, s_e) for _ in self.freqs
                 ]
             elif self.physics == "TDEM":
                 srcList = [TDEM.Src.RawVec_Grounded([], self.s_e)]
@@ -83,6 +270,73 @@ class BaseCasingSrc(BaseCasing):
         return self._srcList
 
 
+class BoreholeWireMixin(object):
+    """
+    Wire path down the center of the borehole, shared by sources that have
+    a vertical segment of wire inside the well. The face indices are cached
+    on the mesh generator so that sources with the same geometry built on
+    the same mesh only compute them once.
+    """
+
+    @property
+    def src_a_closest(self):
+        """
+        closest face to where we want the return current electrode
+        """
+        if getattr(self, '_src_a_closest', None) is None:
+            # find the z location of the closest face to the src
+            self._src_a_closest = self._closest_Fz(self.src_a)
+        return self._src_a_closest
+
+    @property
+    def src_b_closest(self):
+        """
+        closest face to where we want the return current electrode
+        """
+        if getattr(self, '_src_b_closest', None) is None:
+            # find the z location of the closest face to the src
+            self._src_b_closest = self._closest_Fz(self.src_b)
+        return self._src_b_closest
+
+    @property
+    def wire_in_borehole(self):
+        """
+        Indices of the verically directed wire inside of the borehole. It goes
+        through the center of the well
+        """
+        if getattr(self, '_wire_in_borehole', None) is None:
+            self._wire_in_borehole = self._shared_indices(
+                'wire_in_borehole', self._find_wire_in_borehole
+            )
+        return self._wire_in_borehole
+
+    def _find_wire_in_borehole(self):
+        mesh = self.mesh
+        src_a = self.src_a
+        src_b = self.src_b
+        hx_min, hy_min, hz_min = self._cell_mins
+        is_sym = self._is_symmetric
+
+        bounds = [
+            (
+                0, np.greater, self.src_a_closest[0] - hx_min/2.,
+                np.less, self.src_a_closest[0] + hx_min/2.
+            ),
+            (
+                2, np.greater_equal, src_a[2] - 0.5*hz_min,
+                np.less, src_b[2] + 1.5*hz_min
+            ),
+        ]
+
+        if not is_sym:
+            bounds.append((
+                1, np.greater, src_a[1] - hy_min/2.,
+                np.less, src_a[1] + hy_min/2.
+            ))
+
+        return _faces_within(mesh.gridFz, bounds)
+
+
 class HorizontalElectricDipole(BaseCasingSrc):
     """
     A horizontal electric dipole
@@ -100,66 +354,63 @@ class HorizontalElectricDipole(BaseCasingSrc):
     @property
     def surface_wire(self):
         """
-        Horizontal part of the wire that runs along the surface
-        (one cell above) from the center of the well to the return electrode
+        Indices of the x-faces for the horizontal part of the wire that runs
+        along the surface (one cell above) from the center of the well to the
+        return electrode
         """
         if getattr(self, '_surface_wire', None) is None:
             mesh = self.mesh
             src_a = self.src_a
             src_b = self.src_b
+            hx_min, hy_min, hz_min = self._cell_mins
+            is_sym = self._is_symmetric
+            x_max = max(float(src_a[0]), float(src_b[0]))
+            x_min = min(float(src_a[0]), float(src_b[0]))
 
             # horizontally directed wire
-            surface_wirex = (
+            bounds = [
                 (
-                    mesh.gridFx[:, 0] <= np.max(
-                        [self.src_a[0], self.src_b[0]]
-                    )
-                ) &
-                (
-                    mesh.gridFx[:, 0] >= np.min(
-                        [self.src_a[0], self.src_b[0]]
-                    )
-                )
-            )
-            surface_wirez = (
-                (mesh.gridFx[:, 2] > src_b[2] - self.mesh.hz.min()/2.) &
-                (mesh.gridFx[:, 2] < src_b[2] + self.mesh.hz.min()/2.)
-            )
-            self._surface_wire = surface_wirex & surface_wirez
+                    2, np.greater, src_b[2] - hz_min/2.,
+                    np.less, src_b[2] + hz_min/2.
+                ),
+                (0, np.greater_equal, x_min, np.less_equal, x_max),
+            ]
 
-            if getattr(mesh, 'isSymmetric', False) is False:
-                surface_wirey = (
-                    (mesh.gridFx[:, 1] > src_b[1] - mesh.hy.min()/2.) &
-                    (mesh.gridFx[:, 1] < src_b[1] + mesh.hy.min()/2.)
-                )
+            if not is_sym:
+                bounds.append((
+                    1, np.greater, src_b[1] - hy_min/2.,
+                    np.less, src_b[1] + hy_min/2.
+                ))
 
-                self._surface_wire = (
-                    self._surface_wire & surface_wirey
-                )
+            self._surface_wire = _faces_within(mesh.gridFx, bounds)
 
         return self._surface_wire
 
     @property
     def surface_wire_direction(self):
         # todo: extend to the case where the wire is not along the x-axis
-        return [-1. if self.src_a[0] < self.src_b[0] else 1.][0]
+        return -1. if self.src_a[0] < self.src_b[0] else 1.
 
     @property
     def s_e(self):
+        """
+        Source current density on faces
+        """
         if getattr(self, '_s_e', None) is None:
-            # downhole source
-            s_x = np.zeros(self.mesh.vnF[0])
-            s_y = np.zeros(self.mesh.vnF[1])
-            s_z = np.zeros(self.mesh.vnF[2])
+            self._s_e = self._cached_s_e(self._assemble_s_e)
+        return self._s_e
 
-            s_x[self.surface_wire] = self.surface_wire_direction  # horizontal part of wire along surface
+    def _assemble_s_e(self):
+        # downhole source
+        nFx, nFy, nFz = self.mesh.vnF
+        s_e = np.zeros(nFx + nFy + nFz)
+        s_x = s_e[:nFx]
 
-            # assemble the source (downhole grounded primary)
-            s_e = np.hstack([s_x, s_y, s_z])
-            self._s_e = s_e/self.mesh.area
-            # self._s_e = self.mesh.getFaceInnerProduct(invMat=True) * s_e
+        s_x[self.surface_wire] = self.surface_wire_direction  # horizontal part of wire along surface
 
-        return self._s_e
+        # assemble the source (downhole grounded primary)
+        # return self.mesh.getFaceInnerProduct(invMat=True) * s_e
+        return self._scale_by_inv_area(s_e, x_inds=[self.surface_wire])
 
     def plot(self, ax=None):
         """
@@ -173,7 +424,7 @@ class HorizontalElectricDipole(BaseCasingSrc):
         ax.plot(
             mesh.gridFx[self.surface_wire, 0],
             mesh.gridFx[self.surface_wire, 2], 'r{}'.format(
-                ['<' if self.surface_wire_direction == -1. else '>'][0]
+                '<' if self.surface_wire_direction == -1. else '>'
             )
         )
 
@@ -185,17 +436,28 @@ class HorizontalElectricDipole(BaseCasingSrc):
 
         .. todo:: check that
         """
+        # the wire is fixed once the mesh is, so only check it once
+        if getattr(self, '_wire_checked', False):
+            return True
+
         # check the surface wire only has one y and one z location
+        assert len(self.surface_wire) > 0, (
+            'the surface wire does not go through any faces'
+        )
         surface_wire = self.mesh.gridFx[self.surface_wire, :]
-        assert len(np.unique(surface_wire[:, 1])) == 1, (
+        spread = np.ptp(surface_wire, axis=0)
+        assert spread[1] == 0, (
             'the surface wire has more than one y-location'
         )
-        assert len(np.unique(surface_wire[:, 2])) == 1, (
+        assert spread[2] == 0, (
             'the surface wire has more than one z-location'
         )
 
+        self._wire_checked = True
+        return True
+
 
-class VerticalElectricDipole(BaseCasingSrc):
+class VerticalElectricDipole(BoreholeWireMixin, BaseCasingSrc):
     """
     A vertical electric dipole. It is not coupled to the casing
 
@@ -204,90 +466,30 @@ class VerticalElectricDipole(BaseCasingSrc):
     """
 
     def __init__(self, **kwargs):
-        assert all(cp.src_a[:2] == cp.src_b[:2]), (
+        super(VerticalElectricDipole, self).__init__(**kwargs)
+        assert all(self.src_a[:2] == self.src_b[:2]), (
             'src_a and src_b must have the same horizontal location'
         )
-        super(VerticalElectricDipole, self).__init__(**kwargs)
-
-    @property
-    def src_a_closest(self):
-        """
-        closest face to where we want the return current electrode
-        """
-        if getattr(self, '_src_a_closest', None) is None:
-            # find the z location of the closest face to the src
-            src_a_closest = (
-                self.mesh.gridFz[closestPoints(self.mesh, self.src_a, 'Fz'), :]
-            )
-            assert(len(src_a_closest) == 1), 'multiple source locs found'
-            self._src_a_closest = src_a_closest[0]
-        return self._src_a_closest
-
-    @property
-    def src_b_closest(self):
-        """
-        closest face to where we want the return current electrode
-        """
-        if getattr(self, '_src_b_closest', None) is None:
-            # find the z location of the closest face to the src
-            src_b_closest = (
-                self.mesh.gridFz[closestPoints(self.mesh, self.src_b, 'Fz'), :]
-            )
-            assert(len(src_b_closest) == 1), 'multiple source locs found'
-            self._src_b_closest = src_b_closest[0]
-        return self._src_b_closest
-
-    @property
-    def wire_in_borehole(self):
-        """
-        Indices of the verically directed wire inside of the borehole. It goes
-        through the center of the well
-        """
-
-        if getattr(self, '_wire_in_borehole', None) is None:
-            mesh = self.mesh
-            src_a = self.src_a
-            src_b = self.src_b
-
-            wire_in_boreholex = (
-                (mesh.gridFz[:, 0] < self.src_a_closest[0] + mesh.hx.min()/2.) &
-                (mesh.gridFz[:, 0] > self.src_a_closest[0] - mesh.hx.min()/2.)
-            )
-            wire_in_boreholez = (
-                (mesh.gridFz[:, 2] >= src_a[2] - 0.5*mesh.hz.min()) &
-                (mesh.gridFz[:, 2] < src_b[2] + 1.5*mesh.hz.min())
-            )
-
-            self._wire_in_borehole = wire_in_boreholex & wire_in_boreholez
-
-            if getattr(mesh, 'isSymmetric', False) is False:
-                wire_in_boreholey = (
-                    (mesh.gridFz[:, 1] > src_a[1] - mesh.hy.min()/2.) &
-                    (mesh.gridFz[:, 1] < src_a[1] + mesh.hy.min()/2.)
-                )
-                self._wire_in_borehole = (
-                    self._wire_in_borehole & wire_in_boreholey
-                )
-
-        return self._wire_in_borehole
 
     @property
     def s_e(self):
         """
-        Source List
+        Source current density on faces
         """
         if getattr(self, '_s_e', None) is None:
-            # downhole source
-            s_x = np.zeros(self.mesh.vnF[0])
-            s_y = np.zeros(self.mesh.vnF[1])
-            s_z = np.zeros(self.mesh.vnF[2])
+            self._s_e = self._cached_s_e(self._assemble_s_e)
+        return self._s_e
 
-            s_z[self.wire_in_borehole] = -1.   # part of wire through borehole
+    def _assemble_s_e(self):
+        # downhole source
+        nFx, nFy, nFz = self.mesh.vnF
+        s_e = np.zeros(nFx + nFy + nFz)
+        s_z = s_e[nFx + nFy:]
 
-            # assemble the source (downhole grounded primary)
-            s_e = np.hstack([s_x, s_y, s_z])
-            self._s_e = s_e/self.mesh.area
-        return self._s_e
+        s_z[self.wire_in_borehole] = -1.   # part of wire through borehole
+
+        # assemble the source (downhole grounded primary)
+        return self._scale_by_inv_area(s_e, z_inds=[self.wire_in_borehole])
 
     def plot(self, ax=None):
         """
@@ -311,19 +513,28 @@ class VerticalElectricDipole(BaseCasingSrc):
 
         .. todo:: check that the wirepath is infact connected.
         """
+        # the wire is fixed once the mesh is, so only check it once
+        if getattr(self, '_wire_checked', False):
+            return True
 
         # check that the wire inside the borehole has only one x, y, location
+        assert len(self.wire_in_borehole) > 0, (
+            'the wire in borehole does not go through any faces'
+        )
         wire_in_borehole = self.mesh.gridFz[self.wire_in_borehole, :]
-        assert len(np.unique(wire_in_borehole[:, 0])) == 1, (
+        spread = np.ptp(wire_in_borehole, axis=0)
+        assert spread[0] == 0, (
             'the wire in borehole has more than one x-location'
         )
-        assert len(np.unique(wire_in_borehole[:, 1])) == 1, (
+        assert spread[1] == 0, (
             'the wire in borehole has more than one y-location'
         )
+
+        self._wire_checked = True
         return True
 
 
-class DownHoleTerminatingSrc(BaseCasingSrc):
+class DownHoleTerminatingSrc(BoreholeWireMixin, BaseCasingSrc):
     """
     A source that terminates down-hole. It is not coupled to the casing
 
@@ -334,164 +545,106 @@ class DownHoleTerminatingSrc(BaseCasingSrc):
     def __init__(self, **kwargs):
         super(DownHoleTerminatingSrc, self).__init__(**kwargs)
 
-    @property
-    def src_a_closest(self):
-        """
-        closest face to where we want the return current electrode
-        """
-        if getattr(self, '_src_a_closest', None) is None:
-            # find the z location of the closest face to the src
-            src_a_closest = (
-                self.mesh.gridFz[closestPoints(self.mesh, self.src_a, 'Fz'), :]
-            )
-            assert(len(src_a_closest) == 1), 'multiple source locs found'
-            self._src_a_closest = src_a_closest[0]
-        return self._src_a_closest
-
-    @property
-    def src_b_closest(self):
-        """
-        closest face to where we want the return current electrode
-        """
-        if getattr(self, '_src_b_closest', None) is None:
-            # find the z location of the closest face to the src
-            src_b_closest = (
-                self.mesh.gridFz[closestPoints(self.mesh, self.src_b, 'Fz'), :]
-            )
-            assert(len(src_b_closest) == 1), 'multiple source locs found'
-            self._src_b_closest = src_b_closest[0]
-        return self._src_b_closest
-
-    @property
-    def wire_in_borehole(self):
-        """
-        Indices of the verically directed wire inside of the borehole. It goes
-        through the center of the well
-        """
-
-        if getattr(self, '_wire_in_borehole', None) is None:
-            mesh = self.mesh
-            src_a = self.src_a
-            src_b = self.src_b
-
-            wire_in_boreholex = (
-                (mesh.gridFz[:, 0] < self.src_a_closest[0] + mesh.hx.min()/2.) &
-                (mesh.gridFz[:, 0] > self.src_a_closest[0] - mesh.hx.min()/2.)
-            )
-            wire_in_boreholez = (
-                (mesh.gridFz[:, 2] >= src_a[2] - 0.5*mesh.hz.min()) &
-                (mesh.gridFz[:, 2] < src_b[2] + 1.5*mesh.hz.min())
-            )
-
-            self._wire_in_borehole = wire_in_boreholex & wire_in_boreholez
-
-            if getattr(mesh, 'isSymmetric', False) is False:
-                wire_in_boreholey = (
-                    (mesh.gridFz[:, 1] > src_a[1] - mesh.hy.min()/2.) &
-                    (mesh.gridFz[:, 1] < src_a[1] + mesh.hy.min()/2.)
-                )
-                self._wire_in_borehole = (
-                    self._wire_in_borehole & wire_in_boreholey
-                )
-
-        return self._wire_in_borehole
-
     @property
     def surface_wire(self):
         """
-        Horizontal part of the wire that runs along the surface
-        (one cell above) from the center of the well to the return electrode
+        Indices of the x-faces for the horizontal part of the wire that runs
+        along the surface (one cell above) from the center of the well to the
+        return electrode
         """
         if getattr(self, '_surface_wire', None) is None:
             mesh = self.mesh
             src_a = self.src_a
             src_b = self.src_b
+            hx_min, hy_min, hz_min = self._cell_mins
+            is_sym = self._is_symmetric
+            x_a = float(self.src_a_closest[0])
+            x_b = float(self.src_b_closest[0])
+            x_max = max(x_a, x_b)
+            x_min = min(x_a, x_b)
 
             # horizontally directed wire
-            surface_wirex = (
-                (
-                    mesh.gridFx[:, 0] <= np.max(
-                        [self.src_a_closest[0], self.src_b_closest[0]]
-                    )
-                ) &
-                (
-                    mesh.gridFx[:, 0] >= np.min(
-                        [self.src_a_closest[0], self.src_b_closest[0]]
-                    )
-                )
-            )
-            surface_wirez = (
-                (mesh.gridFx[:, 2] > mesh.hz.min()) &
-                (mesh.gridFx[:, 2] <= 1.75*mesh.hz.min())
-            )
-            self._surface_wire = surface_wirex & surface_wirez
+            bounds = [
+                (2, np.greater, hz_min, np.less_equal, 1.75*hz_min),
+                (0, np.greater_equal, x_min, np.less_equal, x_max),
+            ]
 
-            if getattr(mesh, 'isSymmetric', False) is False:
-                surface_wirey = (
-                    (mesh.gridFx[:, 1] > src_b[1] - mesh.hy.min()/2.) &
-                    (mesh.gridFx[:, 1] < src_b[1] + mesh.hy.min()/2.)
-                )
+            if not is_sym:
+                bounds.append((
+                    1, np.greater, src_b[1] - hy_min/2.,
+                    np.less, src_b[1] + hy_min/2.
+                ))
 
-                self._surface_wire = self._surface_wire & surface_wirey
+            self._surface_wire = _faces_within(mesh.gridFx, bounds)
 
         return self._surface_wire
 
     @property
     def surface_electrode(self):
         """
-        Return electrode on the surface
+        Indices of the z-faces for the return electrode on the surface
         """
         if getattr(self, '_surface_electrode', None) is None:
             mesh = self.mesh
             src_a = self.src_a
             src_b = self.src_b
+            hx_min, hy_min, hz_min = self._cell_mins
+            is_sym = self._is_symmetric
 
             # return electrode
-            surface_electrodex = (
-                (mesh.gridFz[:, 0] > self.src_b_closest[0] - mesh.hx.min()/2.) &
-                (mesh.gridFz[:, 0] < self.src_b_closest[0] + mesh.hx.min()/2.)
-            )
-            surface_electrodez = (
-                (mesh.gridFz[:, 2] >= src_b[2] - mesh.hz.min()) &
-                (mesh.gridFz[:, 2] < src_b[2] + 1.75*mesh.hz.min())
-            )
-            self._surface_electrode = surface_electrodex & surface_electrodez
-
-            if getattr(mesh, 'isSymmetric', False) is False:
-                surface_electrodey = (
-                    (mesh.gridFz[:, 1] > src_b[1] - mesh.hy.min()/2.) &
-                    (mesh.gridFz[:, 1] < src_b[1] + mesh.hy.min()/2.)
-                )
-                self._surface_electrode = (
-                    self._surface_electrode & surface_electrodey
-                )
+            bounds = [
+                (
+                    0, np.greater, self.src_b_closest[0] - hx_min/2.,
+                    np.less, self.src_b_closest[0] + hx_min/2.
+                ),
+                (
+                    2, np.greater_equal, src_b[2] - hz_min,
+                    np.less, src_b[2] + 1.75*hz_min
+                ),
+            ]
+
+            if not is_sym:
+                bounds.append((
+                    1, np.greater, src_b[1] - hy_min/2.,
+                    np.less, src_b[1] + hy_min/2.
+                ))
+
+            self._surface_electrode = _faces_within(mesh.gridFz, bounds)
+
         return self._surface_electrode
 
     @property
     def surface_wire_direction(self):
         # todo: extend to the case where the wire is not along the x-axis
-        return [-1. if self.src_a[0] < self.src_b[0] else 1.][0]
+        return -1. if self.src_a[0] < self.src_b[0] else 1.
 
     @property
     def s_e(self):
         """
-        Source List
+        Source current density on faces
         """
-        if getattr(self, '_srcList', None) is None:
-            # downhole source
-            s_x = np.zeros(self.mesh.vnF[0])
-            s_y = np.zeros(self.mesh.vnF[1])
-            s_z = np.zeros(self.mesh.vnF[2])
-
-            s_z[self.wire_in_borehole] = -1.   # part of wire through borehole
-            s_x[self.surface_wire] = self.surface_wire_direction  # horizontal part of wire along surface
-            s_z[self.surface_electrode] = 1.  # vertical part of return electrode
-
-            # assemble the source (downhole grounded primary)
-            s_e = np.hstack([s_x, s_y, s_z])
-            self._s_e = s_e/self.mesh.area
+        if getattr(self, '_s_e', None) is None:
+            self._s_e = self._cached_s_e(self._assemble_s_e)
         return self._s_e
 
+    def _assemble_s_e(self):
+        # downhole source
+        nFx, nFy, nFz = self.mesh.vnF
+        s_e = np.zeros(nFx + nFy + nFz)
+        s_x = s_e[:nFx]
+        s_z = s_e[nFx + nFy:]
+
+        s_z[self.wire_in_borehole] = -1.   # part of wire through borehole
+        s_x[self.surface_wire] = self.surface_wire_direction  # horizontal part of wire along surface
+        s_z[self.surface_electrode] = 1.  # vertical part of return electrode
+
+        # assemble the source (downhole grounded primary)
+        return self._scale_by_inv_area(
+            s_e,
+            x_inds=[self.surface_wire],
+            z_inds=[self.wire_in_borehole, self.surface_electrode]
+        )
+
     def plot(self, ax=None):
         """
         Plot the source.
@@ -512,7 +665,7 @@ class DownHoleTerminatingSrc(BaseCasingSrc):
         ax.plot(
             mesh.gridFx[self.surface_wire, 0],
             mesh.gridFx[self.surface_wire, 2], 'r{}'.format(
-                ['<' if self.surface_wire_direction == -1. else '>'][0]
+                '<' if self.surface_wire_direction == -1. else '>'
             )
         )
 
@@ -524,32 +677,50 @@ class DownHoleTerminatingSrc(BaseCasingSrc):
 
         .. todo:: check that
         """
+        # the wire is fixed once the mesh is, so only check it once
+        if getattr(self, '_wire_checked', False):
+            return True
+
         # check the surface electrode only has one x and one y location
+        assert len(self.surface_electrode) > 0, (
+            'the surface electrode does not go through any faces'
+        )
         surface_electrode = self.mesh.gridFz[self.surface_electrode, :]
-        assert len(np.unique(surface_electrode[:, 0])) == 1, (
+        spread = np.ptp(surface_electrode, axis=0)
+        assert spread[0] == 0, (
             'the surface electrode has more than one x-location'
         )
-        assert len(np.unique(surface_electrode[:, 1])) == 1, (
+        assert spread[1] == 0, (
             'the surface electrode has more than one y-location'
         )
 
         # check the surface wire only has one y and one z location
+        assert len(self.surface_wire) > 0, (
+            'the surface wire does not go through any faces'
+        )
         surface_wire = self.mesh.gridFx[self.surface_wire, :]
-        assert len(np.unique(surface_wire[:, 1])) == 1, (
+        spread = np.ptp(surface_wire, axis=0)
+        assert spread[1] == 0, (
             'the surface wire has more than one y-location'
         )
-        assert len(np.unique(surface_wire[:, 2])) == 1, (
+        assert spread[2] == 0, (
             'the surface wire has more than one z-location'
         )
 
         # check that the wire inside the borehole has only one x, y, location
+        assert len(self.wire_in_borehole) > 0, (
+            'the wire in borehole does not go through any faces'
+        )
         wire_in_borehole = self.mesh.gridFz[self.wire_in_borehole, :]
-        assert len(np.unique(wire_in_borehole[:, 0])) == 1, (
+        spread = np.ptp(wire_in_borehole, axis=0)
+        assert spread[0] == 0, (
             'the wire in borehole has more than one x-location'
         )
-        assert len(np.unique(wire_in_borehole[:, 1])) == 1, (
+        assert spread[1] == 0, (
             'the wire in borehole has more than one y-location'
         )
+
+        self._wire_checked = True
         return True
 
 
@@ -569,57 +740,54 @@ class DownHoleCasingSrc(DownHoleTerminatingSrc):
     @property
     def downhole_electrode(self):
         """
-        Down-hole horizontal part of the wire, coupled to the casing
+        Indices of the x-faces for the down-hole horizontal part of the wire,
+        coupled to the casing
         """
         if getattr(self, '_downhole_electrode', None) is None:
             mesh = self.mesh
             src_a = self.src_a
             src_b = self.src_b
+            hx_min, hy_min, hz_min = self._cell_mins
+            is_sym = self._is_symmetric
 
-            # couple to the casing downhole - top part
-            downhole_electrode_indx = mesh.gridFx[:, 0] <= self.casing_a  # + mesh.hx.min()*2
-
-            # couple to the casing downhole - bottom part
-            downhole_electrode_indz2 = (
-                (mesh.gridFx[:, 2] <= src_a[2]) &
-                (mesh.gridFx[:, 2] > src_a[2] - mesh.hz.min())
-            )
+            bounds = [
+                # couple to the casing downhole - bottom part
+                (2, np.greater, src_a[2] - hz_min, np.less_equal, src_a[2]),
+                # couple to the casing downhole - top part
+                (
+                    0, np.greater_equal, -np.inf,
+                    np.less_equal, self.casing_a  # + mesh.hx.min()*2
+                ),
+            ]
 
-            self._downhole_electrode = (
-                downhole_electrode_indx & downhole_electrode_indz2
-            )
+            if not is_sym:
+                bounds.append((
+                    1, np.greater, src_a[1] - hy_min/2.,
+                    np.less, src_a[1] + hy_min/2.
+                ))
 
-            if getattr(mesh, 'isSymmetric', False) is False:
-                dowhhole_electrode_indy = (
-                    (mesh.gridFx[:, 1] > src_a[1] - mesh.hy.min()/2.) &
-                    (mesh.gridFx[:, 1] < src_a[1] + mesh.hy.min()/2.)
-                )
-                self._downhole_electrode = (
-                    self._downhole_electrode & dowhhole_electrode_indy
-                )
+            self._downhole_electrode = _faces_within(mesh.gridFx, bounds)
 
         return self._downhole_electrode
 
-    @property
-    def s_e(self):
-        """
-        Source current density on faces
-        """
-        if getattr(self, '_srcList', None) is None:
-            # downhole source
-            s_x = np.zeros(self.mesh.vnF[0])
-            s_y = np.zeros(self.mesh.vnF[1])
-            s_z = np.zeros(self.mesh.vnF[2])
-
-            s_z[self.wire_in_borehole] = -1.  # part of wire through borehole
-            s_x[self.downhole_electrode] = 1.  # downhole hz part of wire
-            s_x[self.surface_wire] = -1.  # horizontal part of wire along surface
-            s_z[self.surface_electrode] = 1.  # vertical part of return electrode
-
-            # assemble the source (downhole grounded primary)
-            s_e = np.hstack([s_x, s_y, s_z])
-            self._s_e =  s_e/self.mesh.area
-        return self._s_e
+    def _assemble_s_e(self):
+        # downhole source
+        nFx, nFy, nFz = self.mesh.vnF
+        s_e = np.zeros(nFx + nFy + nFz)
+        s_x = s_e[:nFx]
+        s_z = s_e[nFx + nFy:]
+
+        s_z[self.wire_in_borehole] = -1.  # part of wire through borehole
+        s_x[self.downhole_electrode] = 1.  # downhole hz part of wire
+        s_x[self.surface_wire] = -1.  # horizontal part of wire along surface
+        s_z[self.surface_electrode] = 1.  # vertical part of return electrode
+
+        # assemble the source (downhole grounded primary)
+        return self._scale_by_inv_area(
+            s_e,
+            x_inds=[self.downhole_electrode, self.surface_wire],
+            z_inds=[self.wire_in_borehole, self.surface_electrode]
+        )
 
     def plot(self, ax=None):
         """
@@ -646,15 +814,24 @@ class DownHoleCasingSrc(DownHoleTerminatingSrc):
 
         .. todo:: check that
         """
+        # the wire is fixed once the mesh is, so only check it once
+        if getattr(self, '_wire_more_checked', False):
+            return True
 
         # check that the down-hole electrode has only one y, one z location
+        assert len(self.downhole_electrode) > 0, (
+            'the downhole electrode does not go through any faces'
+        )
         downhole_electrode = self.mesh.gridFx[self.downhole_electrode, :]
-        assert len(np.unique(downhole_electrode[:, 1])) == 1, (
+        spread = np.ptp(downhole_electrode, axis=0)
+        assert spread[1] == 0, (
             'the downhole electrode has more than one y-location'
         )
-        assert len(np.unique(downhole_electrode[:, 2])) == 1, (
+        assert spread[2] == 0, (
             'the downhole electrode has more than one z-location'
         )
+
+        self._wire_more_checked = True
         return True
 
 
@@ -679,27 +856,27 @@ class TopCasingSrc(DownHoleTerminatingSrc):
             mesh = self.mesh
             src_a = self.src_a
             src_b = self.src_b
+            hx_min, hy_min, hz_min = self._cell_mins
+            is_sym = self._is_symmetric
 
-            tophole_electrodex = (
-                (mesh.gridFz[:, 0] <= self.casing_a + mesh.hx.min()) &
-                (mesh.gridFz[:, 0] > self.casing_a)
-            )
-
-            tophole_electrodez = (
-                (mesh.gridFz[:, 2] < src_a[2] + 1.5*mesh.hz.min()) &
-                (mesh.gridFz[:, 2] >= src_a[2] - 0.5*mesh.hz.min())
-            )
+            bounds = [
+                (
+                    0, np.greater, self.casing_a,
+                    np.less_equal, self.casing_a + hx_min
+                ),
+                (
+                    2, np.greater_equal, src_a[2] - 0.5*hz_min,
+                    np.less, src_a[2] + 1.5*hz_min
+                ),
+            ]
 
-            self._tophole_electrode = tophole_electrodex & tophole_electrodez
+            if not is_sym:
+                bounds.append((
+                    1, np.greater, src_a[1] - hy_min,
+                    np.less, src_a[1] + hy_min
+                ))
 
-            if getattr(mesh, 'isSymmetric', False) is False:
-                tophole_electrodey = (
-                    (mesh.gridFz[:, 1] > src_a[1] - mesh.hy.min()) &
-                    (mesh.gridFz[:, 1] < src_a[1] + mesh.hy.min())
-                )
-                self._tophole_electrode = (
-                    self._tophole_electrode & tophole_electrodey
-                )
+            self._tophole_electrode = _faces_within(mesh.gridFz, bounds)
 
         return self._tophole_electrode
 
@@ -712,46 +889,48 @@ class TopCasingSrc(DownHoleTerminatingSrc):
             mesh = self.mesh
             src_a = self.src_a
             src_b = self.src_b
+            hx_min, hy_min, hz_min = self._cell_mins
+            is_sym = self._is_symmetric
 
             # horizontally directed wire
-            surface_wirex = (
-                (mesh.gridFx[:, 0] <= self.src_b_closest[0]) &
-                (mesh.gridFx[:, 0] > self.casing_a + mesh.hx.min()/2.)
-            )
-            surface_wirez = (
-                (mesh.gridFx[:, 2] > src_b[2] + mesh.hz.min()) &
-                (mesh.gridFx[:, 2] <= src_b[2] + 1.75*mesh.hz.min())
-            )
-            self._surface_wire = surface_wirex & surface_wirez
-
-            if getattr(mesh, 'isSymmetric', False) is False:
-                surface_wirey = (
-                    (mesh.gridFx[:, 1] < src_b[1] + mesh.hy.min()/2.) &
-                    (mesh.gridFx[:, 1] > src_b[1] - mesh.hy.min()/2.)
-                )
-                self._surface_wire = self._surface_wire & surface_wirey
+            bounds = [
+                (
+                    2, np.greater, src_b[2] + hz_min,
+                    np.less_equal, src_b[2] + 1.75*hz_min
+                ),
+                (
+                    0, np.greater, self.casing_a + hx_min/2.,
+                    np.less_equal, self.src_b_closest[0]
+                ),
+            ]
+
+            if not is_sym:
+                bounds.append((
+                    1, np.greater, src_b[1] - hy_min/2.,
+                    np.less, src_b[1] + hy_min/2.
+                ))
+
+            self._surface_wire = _faces_within(mesh.gridFx, bounds)
         return self._surface_wire
 
-    @property
-    def s_e(self):
-        """
-        source list
-        """
-        if getattr(self, '_srcList', None) is None:
-            # downhole source
-            s_x = np.zeros(self.mesh.vnF[0])
-            s_y = np.zeros(self.mesh.vnF[1])
-            s_z = np.zeros(self.mesh.vnF[2])
-
-            s_z[self.tophole_electrode] = -1.  # part of wire coupled to casing
-            s_x[self.surface_wire] = -1.  # horizontal part of wire along surface
-            s_z[self.surface_electrode] = 1.  # vertical part of return electrode
-
-            # assemble se source (downhole grounded primary)
-            s_e = np.hstack([s_x, s_y, s_z])
-            self._s_e = s_e/self.mesh.area
-            # self._s_e = self.mesh.getFaceInnerProduct(invMat=True) * s_e
-        return self._s_e
+    def _assemble_s_e(self):
+        # downhole source
+        nFx, nFy, nFz = self.mesh.vnF
+        s_e = np.zeros(nFx + nFy + nFz)
+        s_x = s_e[:nFx]
+        s_z = s_e[nFx + nFy:]
+
+        s_z[self.tophole_electrode] = -1.  # part of wire coupled to casing
+        s_x[self.surface_wire] = -1.  # horizontal part of wire along surface
+        s_z[self.surface_electrode] = 1.  # vertical part of return electrode
+
+        # assemble se source (downhole grounded primary)
+        # return self.mesh.getFaceInnerProduct(invMat=True) * s_e
+        return self._scale_by_inv_area(
+            s_e,
+            x_inds=[self.surface_wire],
+            z_inds=[self.tophole_electrode, self.surface_electrode]
+        )
 
     def plot(self, ax=None):
         """
@@ -783,31 +962,48 @@ class TopCasingSrc(DownHoleTerminatingSrc):
         Make sure that each segment of the wire is only going through a
         single face
         """
+        # the wire is fixed once the mesh is, so only check it once
+        if getattr(self, '_wire_checked', False):
+            return True
+
         # check the surface electrode only has one x and one y location
+        assert len(self.surface_electrode) > 0, (
+            'the surface electrode does not go through any faces'
+        )
         surface_electrode = self.mesh.gridFz[self.surface_electrode, :]
-        assert len(np.unique(surface_electrode[:, 0])) == 1, (
+        spread = np.ptp(surface_electrode, axis=0)
+        assert spread[0] == 0, (
             'the surface electrode has more than one x-location'
         )
-        assert len(np.unique(surface_electrode[:, 1])) == 1, (
+        assert spread[1] == 0, (
             'the surface electrode has more than one y-location'
         )
 
         # check the top casing electrode only has one x and one y location
+        assert len(self.tophole_electrode) > 0, (
+            'the tophole electrode does not go through any faces'
+        )
         tophole_electrode = self.mesh.gridFz[self.tophole_electrode, :]
-        assert len(np.unique(tophole_electrode[:, 0])) == 1, (
+        spread = np.ptp(tophole_electrode, axis=0)
+        assert spread[0] == 0, (
             'the tophole electrode has more than one x-location'
         )
-        assert len(np.unique(tophole_electrode[:, 1])) == 1, (
+        assert spread[1] == 0, (
             'the tophole electrode has more than one y-location'
         )
 
         # check the surface wire only has one y and one z location
+        assert len(self.surface_wire) > 0, (
+            'the surface wire does not go through any faces'
+        )
         surface_wire = self.mesh.gridFx[self.surface_wire, :]
-        assert len(np.unique(surface_wire[:, 1])) == 1, (
+        spread = np.ptp(surface_wire, axis=0)
+        assert spread[1] == 0, (
             'the surface wire has more than one y-location'
         )
-        assert len(np.unique(surface_wire[:, 2])) == 1, (
+        assert spread[2] == 0, (
             'the surface wire has more than one z-location'
         )
 
+        self._wire_checked = True
         return True
@@ -10,7 +10,7 @@ class TestMeshConstruction(unittest.TestCase):
 
     def setUp(self):
         sigma_back = 0.1
-        cart_cp = casingSimulations.CasingParameters(
+        cart_cp = casingSimulations.model.CasingInSingleLayer(
             sigma_casing = sigma_back,
             sigma_inside = sigma_back,
             sigma_layer = sigma_back,
@@ -45,7 +45,7 @@ class TestMeshConstruction(unittest.TestCase):
             np.ceil(domain_y / csy) + 2*nch
         )
         ncz = int(
-            np.ceil((cart_cp.casing_z[1] - cart_cp.casing_z[0]) / csz) +
+            np.ceil((cart_cp.src_b[2] - cart_cp.src_a[2]) / csz) +
             nca + ncb
         )
 
@@ -95,5 +95,25 @@ class TestMeshConstruction(unittest.TestCase):
         self.assertTrue(np.all(self.mesh_d.hy == self.mesh_c.hy))
         self.assertTrue(np.all(self.mesh_d.hz == self.mesh_c.hz))
 
+    def test_closest_Fz(self):
+        mesh = self.mesh_c
+
+        # the electrodes, plus points on the cell edges: these are equally
+        # far from two (or more) face centers, so the tie-break matters
+        locs = [self.meshGen.cp.src_a, self.meshGen.cp.src_b]
+        for x in mesh.vectorNx[::7]:
+            for z in mesh.vectorNz[::7]:
+                locs.append(np.r_[x, 0., z])
+                locs.append(np.r_[x, mesh.vectorNy[5], z])
+
+        # closestPoints takes the first of the equally close faces (newer
+        # versions of discretize use a KD-tree and may not), so compare with
+        # the brute force search directly
+        for loc in locs:
+            self.assertEqual(
+                self.meshGen.closest_Fz(loc),
+                ((mesh.gridFz - loc)**2).sum(axis=1).argmin()
+            )
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,302 @@
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+
+import casingSimulations
+from casingSimulations import sources
+
+
+def get_cp(src_a=np.r_[0., 0., -200.], src_b=np.r_[-200., 0., 0.]):
+    return casingSimulations.model.CasingInHalfspace(
+        casing_l=200.,
+        src_a=src_a,
+        src_b=src_b,
+        freqs=np.r_[0.5, 1.]
+    )
+
+
+def get_meshGenerator(cp, csx=25.):
+    return casingSimulations.TensorMeshGenerator(
+        cp=cp,
+        csx=csx,
+        csy=csx,
+        csz=csx,
+        # an odd number of core cells in y, so that y=0 is a cell center
+        # and the wire paths go through a row of faces
+        domain_y=75.,
+        npadx=3,
+        npady=3,
+        npadz=3,
+        nca=2,
+        ncb=2,
+        nch=2
+    )
+
+
+class TestSourceCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.cp = get_cp()
+        self.meshGen = get_meshGenerator(self.cp)
+
+    def test_s_e_cached(self):
+        for Src in [
+            sources.DownHoleTerminatingSrc, sources.DownHoleCasingSrc,
+            sources.TopCasingSrc
+        ]:
+            src = Src(cp=self.cp, meshGenerator=self.meshGen, physics="FDEM")
+            self.assertTrue(src.s_e is src.s_e)
+            self.assertTrue(src.srcList is src.srcList)
+
+    def test_reset_on_new_mesh(self):
+        src = sources.DownHoleCasingSrc(
+            cp=self.cp, meshGenerator=self.meshGen, physics="FDEM"
+        )
+        src.srcList
+        self.assertTrue(src._s_e is not None)
+        self.assertTrue(src._srcList is not None)
+
+        src.meshGenerator = get_meshGenerator(self.cp, csx=20.)
+        self.assertTrue(src._s_e is None)
+        self.assertTrue(src._srcList is None)
+
+        # and the source is rebuilt on the new mesh
+        self.assertEqual(len(src.s_e), src.mesh.nF)
+
+    def test_shared_wire_in_borehole(self):
+        cp = get_cp(src_b=np.r_[0., 0., 0.])
+        meshGen = get_meshGenerator(cp)
+
+        ved = sources.VerticalElectricDipole(cp=cp, meshGenerator=meshGen)
+        dht = sources.DownHoleTerminatingSrc(cp=cp, meshGenerator=meshGen)
+        self.assertTrue(len(ved.wire_in_borehole) > 0)
+        self.assertTrue(ved.wire_in_borehole is dht.wire_in_borehole)
+        self.assertEqual(len(meshGen.source_cache), 1)
+
+        # a shorter wire on the same mesh gets its own entry
+        other = sources.VerticalElectricDipole(
+            cp=get_cp(src_a=np.r_[0., 0., -100.], src_b=np.r_[0., 0., 0.]),
+            meshGenerator=meshGen
+        )
+        self.assertTrue(
+            len(other.wire_in_borehole) < len(ved.wire_in_borehole)
+        )
+        self.assertEqual(len(meshGen.source_cache), 2)
+
+
+class TestSourceVector(unittest.TestCase):
+    """
+    compare s_e with the source vector assembled on all faces and divided by
+    the face areas
+    """
+
+    def setUp(self):
+        # return electrode on the +x side, as TopCasingSrc expects
+        self.cp = get_cp(src_b=np.r_[200., 0., 0.])
+        self.meshGen = get_meshGenerator(self.cp)
+
+    def compare(self, src, x_values=(), z_values=()):
+        # every segment of the wire goes through faces
+        self.assertTrue(src.validate())
+
+        mesh = src.mesh
+        s_x = np.zeros(mesh.vnF[0])
+        s_y = np.zeros(mesh.vnF[1])
+        s_z = np.zeros(mesh.vnF[2])
+        for inds, value in x_values:
+            self.assertTrue(len(inds) > 0)
+            s_x[inds] = value
+        for inds, value in z_values:
+            self.assertTrue(len(inds) > 0)
+            s_z[inds] = value
+        s_e = np.hstack([s_x, s_y, s_z])/mesh.area
+
+        self.assertTrue(np.any(s_e != 0))
+        self.assertTrue(np.allclose(src.s_e, s_e, rtol=1e-12, atol=0.))
+
+    def test_HorizontalElectricDipole(self):
+        # the wire runs through the x-faces at the cell centers in z
+        cp = get_cp(src_a=np.r_[0., 0., -12.5], src_b=np.r_[-200., 0., -12.5])
+        src = sources.HorizontalElectricDipole(
+            cp=cp, meshGenerator=get_meshGenerator(cp), physics="FDEM"
+        )
+        self.compare(
+            src, x_values=[(src.surface_wire, src.surface_wire_direction)]
+        )
+
+    def test_VerticalElectricDipole(self):
+        cp = get_cp(src_b=np.r_[0., 0., 0.])
+        src = sources.VerticalElectricDipole(
+            cp=cp, meshGenerator=get_meshGenerator(cp), physics="FDEM"
+        )
+        self.compare(src, z_values=[(src.wire_in_borehole, -1.)])
+
+    def test_DownHoleTerminatingSrc(self):
+        src = sources.DownHoleTerminatingSrc(
+            cp=self.cp, meshGenerator=self.meshGen, physics="FDEM"
+        )
+        self.compare(
+            src,
+            x_values=[(src.surface_wire, src.surface_wire_direction)],
+            z_values=[
+                (src.wire_in_borehole, -1.), (src.surface_electrode, 1.)
+            ]
+        )
+
+    def test_DownHoleCasingSrc(self):
+        src = sources.DownHoleCasingSrc(
+            cp=self.cp, meshGenerator=self.meshGen, physics="FDEM"
+        )
+        self.compare(
+            src,
+            x_values=[(src.downhole_electrode, 1.), (src.surface_wire, -1.)],
+            z_values=[
+                (src.wire_in_borehole, -1.), (src.surface_electrode, 1.)
+            ]
+        )
+
+    def test_TopCasingSrc(self):
+        src = sources.TopCasingSrc(
+            cp=self.cp, meshGenerator=self.meshGen, physics="FDEM"
+        )
+        self.compare(
+            src,
+            x_values=[(src.surface_wire, -1.)],
+            z_values=[
+                (src.tophole_electrode, -1.), (src.surface_electrode, 1.)
+            ]
+        )
+
+
+class TestWireChecks(unittest.TestCase):
+
+    def setUp(self):
+        self.cp = get_cp(src_b=np.r_[200., 0., 0.])
+        self.meshGen = get_meshGenerator(self.cp)
+
+    def test_checked_once_per_mesh(self):
+        src = sources.DownHoleCasingSrc(
+            cp=self.cp, meshGenerator=self.meshGen, physics="FDEM"
+        )
+        self.assertTrue(src.validate())
+        self.assertTrue(src._wire_checked)
+        self.assertTrue(src._wire_more_checked)
+
+        # the wire is not checked again on the same mesh
+        src._surface_wire = np.array([], dtype=int)
+        self.assertTrue(src.validate())
+
+        # a new mesh clears the flags and the wire is checked again
+        src.meshGenerator = get_meshGenerator(self.cp)
+        self.assertTrue(src._wire_checked is None)
+        self.assertTrue(src._wire_more_checked is None)
+        self.assertTrue(src.validate())
+        self.assertTrue(src._wire_checked)
+        self.assertTrue(src._wire_more_checked)
+
+        src.meshGenerator = get_meshGenerator(self.cp)
+        src._surface_wire = np.array([], dtype=int)
+        self.assertRaises(AssertionError, src.validate)
+
+    def test_empty_segment(self):
+        # with the return electrode on the -x side, the surface wire of a
+        # TopCasingSrc does not go through any faces
+        cp = get_cp()
+        src = sources.TopCasingSrc(
+            cp=cp, meshGenerator=get_meshGenerator(cp), physics="FDEM"
+        )
+        self.assertEqual(len(src.surface_wire), 0)
+
+        with self.assertRaises(AssertionError) as context:
+            src.validate()
+        self.assertEqual(
+            str(context.exception),
+            'the surface wire does not go through any faces'
+        )
+        self.assertFalse(getattr(src, '_wire_checked', False))
+
+
+class TestSeDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_directory = sources.S_E_CACHE_DIRECTORY
+        self.tmpdir = tempfile.mkdtemp()
+        # a directory that does not exist yet, so that it is created
+        sources.S_E_CACHE_DIRECTORY = os.path.join(self.tmpdir, 'cache')
+
+        self.cp = get_cp()
+        self.meshGen = get_meshGenerator(self.cp)
+
+    def tearDown(self):
+        sources.S_E_CACHE_DIRECTORY = self.cache_directory
+        shutil.rmtree(self.tmpdir)
+
+    def get_src(self, cp=None, meshGen=None):
+        return sources.DownHoleTerminatingSrc(
+            cp=self.cp if cp is None else cp,
+            meshGenerator=self.meshGen if meshGen is None else meshGen,
+            cache_s_e=True
+        )
+
+    def test_save_and_load(self):
+        src = self.get_src()
+        s_e = src.s_e
+        self.assertTrue(os.path.isfile(src._s_e_cache_path))
+        self.assertEqual(
+            os.listdir(sources.S_E_CACHE_DIRECTORY),
+            [os.path.basename(src._s_e_cache_path)]
+        )
+
+        # a new source with the same geometry and mesh loads it from disk
+        src2 = self.get_src(meshGen=get_meshGenerator(self.cp))
+        self.assertEqual(src2._s_e_cache_path, src._s_e_cache_path)
+        src2._assemble_s_e = None  # make sure it is not re-assembled
+        self.assertTrue(np.all(src2.s_e == s_e))
+
+    def test_rebuild_bad_file(self):
+        src = self.get_src()
+        os.makedirs(sources.S_E_CACHE_DIRECTORY)
+        np.save(src._s_e_cache_path, np.ones(3))
+
+        # the file does not fit the mesh, so s_e is assembled and saved
+        self.assertEqual(len(src.s_e), src.mesh.nF)
+        self.assertTrue(np.all(np.load(src._s_e_cache_path) == src.s_e))
+
+    def test_cache_path(self):
+        path = self.get_src()._s_e_cache_path
+
+        # different mesh
+        self.assertNotEqual(
+            self.get_src(
+                meshGen=get_meshGenerator(self.cp, csx=20.)
+            )._s_e_cache_path,
+            path
+        )
+
+        # different geometry
+        cp = get_cp(src_b=np.r_[-150., 0., 0.])
+        self.assertNotEqual(
+            self.get_src(cp=cp)._s_e_cache_path, path
+        )
+
+        # different version of the cache
+        version = sources.S_E_CACHE_VERSION
+        sources.S_E_CACHE_VERSION = version + 1
+        try:
+            self.assertNotEqual(self.get_src()._s_e_cache_path, path)
+        finally:
+            sources.S_E_CACHE_VERSION = version
+
+        # different source type
+        self.assertNotEqual(
+            sources.TopCasingSrc(
+                cp=self.cp, meshGenerator=self.meshGen, cache_s_e=True
+            )._s_e_cache_path,
+            path
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()